@@ -5,6 +5,8 @@ also represents a file on disk.
 
 """
 import logging
+import os
+import pickle
 import shutil
 from abc import ABC, abstractclassmethod, abstractmethod
 from contextlib import contextmanager
@@ -14,9 +16,12 @@ from pathlib import Path
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
     Generic,
+    Iterable,
     List,
+    NamedTuple,
     Optional,
     Set,
     Tuple,
@@ -27,11 +32,15 @@ from typing import (
 from weakref import WeakValueDictionary
 
 from pydantic import BaseModel as PydanticBaseModel
-from pydantic import validator
+from pydantic import Extra, validator
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
+from pydantic.errors import ExtraError
 from pydantic.fields import ModelField, PrivateAttr
+from pydantic.typing import get_args, get_origin, is_literal_type
 
+from hydrolib.core import __version__
 from hydrolib.core.base import DummmyParser, DummySerializer
+from hydrolib.core.config import settings
 from hydrolib.core.utils import (
     FilePathStyleConverter,
     OperatingSystem,
@@ -49,6 +58,26 @@ logger = logging.getLogger(__name__)
 # we could move to https://github.com/samuelcolvin/pydantic/issues/1549
 context_file_loading: ContextVar["FileLoadContext"] = ContextVar("file_loading")
 
+# Version of the contents of the parse cache files, which should be increased when
+# the layout of the cache files changes. Together with the hydrolib version it
+# ensures cache files are only used by the build that wrote them.
+_PARSE_CACHE_FORMAT = 1
+
+
+def _may_contain_model(type_: Any) -> bool:
+    """Whether values of the given field type may contain a BaseModel.
+
+    Types that cannot be inspected, such as Any and forward references, are assumed
+    to possibly contain a BaseModel.
+    """
+    if is_literal_type(type_):
+        return False
+    if get_origin(type_) is not None:
+        return any(_may_contain_model(arg) for arg in get_args(type_))
+    if isinstance(type_, type):
+        return issubclass(type_, PydanticBaseModel) or type_ is object
+    return True
+
 
 class BaseModel(PydanticBaseModel):
     class Config:
@@ -59,6 +88,21 @@ class BaseModel(PydanticBaseModel):
         allow_population_by_field_name = True
         alias_generator = to_key
 
+    # Names of the fields that may contain (lists of) child models, or None when
+    # all values need to be inspected because extra fields are allowed.
+    _model_field_names: ClassVar[Optional[Tuple[str, ...]]] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.__config__.extra == Extra.allow:
+            cls._model_field_names = None
+        else:
+            cls._model_field_names = tuple(
+                name
+                for name, field in cls.__fields__.items()
+                if _may_contain_model(field.outer_type_)
+            )
+
     def __init__(self, **data: Any) -> None:
         """Initialize a BaseModel with the provided data.
 
@@ -105,7 +149,7 @@ class BaseModel(PydanticBaseModel):
             print(" " * indent * 2, angle, self)
 
         # Otherwise we recurse through the fields of a model
-        for _, value in self:
+        for value in self._child_model_candidates():
             # Handle lists of items
             if not isinstance(value, list):
                 value = [value]
@@ -118,7 +162,7 @@ class BaseModel(PydanticBaseModel):
 
     def _apply_recurse(self, f, *args, **kwargs):
         # TODO Could we use this function for `show_tree`?
-        for _, value in self:
+        for value in self._child_model_candidates():
             # Handle lists of items
             if not isinstance(value, list):
                 value = [value]
@@ -130,6 +174,13 @@ class BaseModel(PydanticBaseModel):
         if self.is_file_link():
             getattr(self, f)(*args, **kwargs)
 
+    def _child_model_candidates(self) -> Iterable[Any]:
+        """Get the field values of this model that may contain child models."""
+        values = self.__dict__
+        if self._model_field_names is None:
+            return values.values()
+        return [values[name] for name in self._model_field_names if name in values]
+
     def _get_identifier(self, data: dict) -> Optional[str]:
         """Get the identifier for this model.
 
@@ -228,7 +279,7 @@ class ModelTreeTraverser(Generic[TAcc]):
         if self._should_execute_pre(model, acc):
             acc = self._pre_traverse_func(model, acc)  # type: ignore[arg-type]
 
-        for _, value in model:
+        for value in model._child_model_candidates():
             if not isinstance(value, list):
                 value = [value]
 
@@ -738,6 +789,9 @@ class FileModel(BaseModel, ABC):
     __slots__ = ["__weakref__"]
     # Use WeakValueDictionary to keep track of file paths with their respective parsed file models.
     _file_models_cache: WeakValueDictionary = WeakValueDictionary()
+    # Subclasses whose parser already produces values of the declared field types
+    # can set this to skip the pydantic validation when loading from file.
+    _trusted_load: bool = False
     filepath: Optional[Path] = None
     # Absolute anchor is used to resolve the save location when the filepath is relative.
     _absolute_anchor_path: Path = PrivateAttr(default_factory=Path.cwd)
@@ -797,7 +851,7 @@ class FileModel(BaseModel, ABC):
 
             if not FileModel._should_load_model(context):
                 super().__init__(*args, **kwargs)
-                self.filepath = filepath
+                self._set_filepath_unvalidated(filepath)
                 return
 
             self._absolute_anchor_path = context.get_current_parent()
@@ -810,6 +864,8 @@ class FileModel(BaseModel, ABC):
             data = self._load(loading_path)
             context.register_model(filepath, self)
             data["filepath"] = filepath
+            # Values passed by the caller still need to be validated.
+            trusted_load = self._trusted_load and not args and not kwargs
             kwargs.update(data)
 
             # Note: the relative mode needs to be obtained from the data directly
@@ -819,11 +875,53 @@ class FileModel(BaseModel, ABC):
             relative_mode = self._get_relative_mode_from_data(data)
             context.push_new_parent(filepath.parent, relative_mode)
 
-            super().__init__(*args, **kwargs)
+            if trusted_load:
+                self._init_from_trusted_data(**kwargs)
+            else:
+                super().__init__(*args, **kwargs)
             self._post_init_load()
 
             context.pop_last_parent()
 
+    def _init_from_trusted_data(self, **data: Any) -> None:
+        """Initialize this FileModel with the provided data without validating it.
+
+        This is only used when loading a model of which the parser is trusted to
+        produce values of the declared field types, see `_trusted_load`, and no
+        other values are provided by the caller.
+
+        Args:
+            data: The parsed data.
+
+        Raises:
+            ValidationError: When the data contains keys that are no field name or
+                alias, as the validating initialization would.
+        """
+        # The values are set the same way as pydantic's construct does, but on this
+        # instance instead of on a newly created model.
+        values: Dict[str, Any] = {}
+        used_keys: Set[str] = set()
+        for name, field in self.__fields__.items():
+            if field.alt_alias and field.alias in data:
+                values[name] = data[field.alias]
+                used_keys.add(field.alias)
+            elif name in data:
+                values[name] = data[name]
+                used_keys.add(name)
+            elif not field.required:
+                values[name] = field.get_default()
+
+        unknown_keys = data.keys() - used_keys
+        if unknown_keys:
+            raise ValidationError(
+                [ErrorWrapper(ExtraError(), loc=key) for key in sorted(unknown_keys)],
+                self.__class__,
+            )
+
+        object.__setattr__(self, "__dict__", values)
+        object.__setattr__(self, "__fields_set__", set(data.keys()))
+        self._init_private_attributes()
+
     @classmethod
     def _should_load_model(cls, context: FileLoadContext) -> bool:
         """Determines whether the file model should be loaded or not.
@@ -969,7 +1067,7 @@ class FileModel(BaseModel, ABC):
 
     def _save_instance(self, save_settings: ModelSaveSettings) -> None:
         if self.filepath is None:
-            self.filepath = self._generate_name()
+            self._set_filepath_unvalidated(self._generate_name())
         self._save(save_settings)
 
     def _save_tree(
@@ -980,7 +1078,7 @@ class FileModel(BaseModel, ABC):
             model: BaseModel, acc: FileLoadContext
         ) -> FileLoadContext:
             if isinstance(model, FileModel) and model.filepath is None:
-                model.filepath = model._generate_name()
+                model._set_filepath_unvalidated(model._generate_name())
             return acc
 
         name_traverser = ModelTreeTraverser[FileLoadContext](
@@ -1121,6 +1219,18 @@ class FileModel(BaseModel, ABC):
         else:
             return Path(filepath)
 
+    def _set_filepath_unvalidated(self, filepath: Optional[Path]) -> None:
+        """Set the filepath of this model without running the assignment validation.
+
+        Only use this for internal writes of values that are already a Path or None,
+        user provided values should be assigned to `filepath` directly.
+
+        Args:
+            filepath (Optional[Path]): The new file path.
+        """
+        object.__setattr__(self, "filepath", filepath)
+        self.__fields_set__.add("filepath")
+
     @validator("filepath")
     def _conform_filepath_to_pathlib(cls, value):
         return FileModel._change_to_path(value)
@@ -1155,6 +1265,19 @@ class SerializerConfig(BaseModel, ABC):
         """
 
 
+class FormatSpec(NamedTuple):
+    """The default file name, parser and serializer of a ParsableFileModel type."""
+
+    default_name: Path
+    parser: Callable[[Path], Dict]
+    serializer: Callable[[Path, Dict, SerializerConfig, ModelSaveSettings], None]
+
+
+# The FormatSpec of every ParsableFileModel type that has been parsed, serialized
+# or named, so these only need a dictionary lookup afterwards.
+_FORMAT_REGISTRY: Dict[type, FormatSpec] = {}
+
+
 class ParsableFileModel(FileModel):
     """ParsableFileModel defines a FileModel which can be parsed
     and serialized with a serializer .
@@ -1175,13 +1298,90 @@ class ParsableFileModel(FileModel):
 
     serializer_config: SerializerConfig = SerializerConfig()
 
+    @classmethod
+    def _register_format(cls) -> FormatSpec:
+        """Register the FormatSpec of this model type and return it.
+
+        This is done on first use instead of when the class is created, because
+        some models import their parser or serializer only when it is requested.
+        """
+        spec = FormatSpec(
+            default_name=Path(f"{cls._filename()}{cls._ext()}"),
+            parser=cls._get_parser(),
+            serializer=cls._get_serializer(),
+        )
+        _FORMAT_REGISTRY[cls] = spec
+        return spec
+
     def _load(self, filepath: Path) -> Dict:
         # TODO Make this lazy in some cases so it doesn't become slow
         if filepath.is_file():
+            if settings.HYDROLIB_CACHE_PARSE:
+                return self._parse_with_cache(filepath)
             return self._parse(filepath)
         else:
             raise ValueError(f"File: `{filepath}` not found, skipped parsing.")
 
+    @classmethod
+    def _parse_with_cache(cls, filepath: Path) -> Dict:
+        """Parse the file at filepath, reusing a pickled side-car cache file.
+
+        The cache file is stored next to filepath with the name of the model type
+        and a ".pkl" suffix appended, such that different model types parsing the
+        same file do not share their results. The cache file stores the hydrolib
+        version, the cache format and the modification time and size of the file it
+        was created from, and is only used when all of these still match. Otherwise
+        the parsed data could have an outdated layout, which is not validated for
+        models with `_trusted_load`. It is written again when it cannot be used.
+        Because unpickling can execute arbitrary code, this should only be enabled
+        for trusted model directories.
+
+        Args:
+            filepath (Path): Path to the data to parse.
+
+        Returns:
+            Dict: The parsed data stored at filepath.
+        """
+        cache_path = filepath.with_name(
+            f"{filepath.name}.{cls.__module__}.{cls.__qualname__}.pkl"
+        )
+        stat = filepath.stat()
+        file_stamp = (
+            __version__,
+            _PARSE_CACHE_FORMAT,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        if cache_path.is_file():
+            try:
+                with cache_path.open("rb") as cache_file:
+                    cached_stamp, cached_data = pickle.load(cache_file)
+                if cached_stamp == file_stamp:
+                    return cached_data
+            except (
+                OSError,
+                EOFError,
+                pickle.UnpicklingError,
+                AttributeError,
+                ImportError,
+                TypeError,
+                ValueError,
+            ) as error:
+                logger.warning(f"Could not read parse cache {cache_path}: {error}")
+
+        data = cls._parse(filepath)
+        # Write to a temporary file first, so an interrupted or concurrent write
+        # never leaves a partial cache file behind.
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with temp_path.open("wb") as cache_file:
+                pickle.dump((file_stamp, data), cache_file, protocol=5)
+            os.replace(temp_path, cache_path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+            logger.warning(f"Could not write parse cache {cache_path}: {error}")
+            temp_path.unlink(missing_ok=True)
+        return data
+
     def _save(self, save_settings: ModelSaveSettings) -> None:
         """Save the data of this FileModel.
 
@@ -1205,7 +1405,10 @@ class ParsableFileModel(FileModel):
             return
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        self._get_serializer()(path, data, self.serializer_config, save_settings)
+        serializer = (
+            _FORMAT_REGISTRY.get(type(self)) or self._register_format()
+        ).serializer
+        serializer(path, data, self.serializer_config, save_settings)
 
     def dict(self, *args, **kwargs):
         kwargs["exclude"] = self._exclude_fields()
@@ -1218,12 +1421,11 @@ class ParsableFileModel(FileModel):
 
     @classmethod
     def _parse(cls, path: Path) -> Dict:
-        return cls._get_parser()(path)
+        return (_FORMAT_REGISTRY.get(cls) or cls._register_format()).parser(path)
 
     @classmethod
     def _generate_name(cls) -> Path:
-        name, ext = cls._filename(), cls._ext()
-        return Path(f"{name}{ext}")
+        return (_FORMAT_REGISTRY.get(cls) or cls._register_format()).default_name
 
     @abstractclassmethod
     def _filename(cls) -> str:
@@ -5,6 +5,7 @@ class Settings(BaseSettings):
     """Configuration management, can be derived from ENV of .env file."""
 
     FM_EXECUTABLE: str = "fm.exe"
+    HYDROLIB_CACHE_PARSE: bool = False
 
 
 # TODO maybe delay init untill model init?
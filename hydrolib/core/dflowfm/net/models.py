@@ -1262,7 +1262,7 @@ class NetworkModel(ParsableFileModel):
 
     def _export(self, folder: Path) -> None:
         filename = Path(self.filepath.name) if self.filepath else self._generate_name()
-        self.filepath = folder / filename
+        self._set_filepath_unvalidated(folder / filename)
         folder.mkdir(parents=True, exist_ok=True)
         self.network.to_file(self.filepath)
 
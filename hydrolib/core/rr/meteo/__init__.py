@@ -1,3 +1,3 @@
-from .models import BuiModel, BuiPrecipitationEvent
+from .models import BuiModel, BuiPrecipitationEvent, BuiPrecipitationEventSequence
 
-__all__ = ["BuiPrecipitationEvent", "BuiModel"]
+__all__ = ["BuiPrecipitationEvent", "BuiPrecipitationEventSequence", "BuiModel"]
@@ -1,22 +1,179 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Type, Union
+
+import numpy as np
+from pydantic.datetime_parse import parse_datetime, parse_duration
+from pydantic.error_wrappers import ErrorWrapper, ValidationError
 
 from hydrolib.core.basemodel import (
-    BaseModel,
     ModelSaveSettings,
     ParsableFileModel,
     SerializerConfig,
 )
 
-from .parser import BuiParser
+from .parser import BuiEventSequence, BuiParser
 from .serializer import write_bui_file
 
 
-class BuiPrecipitationEvent(BaseModel):
+def _to_precipitation_array(value: Any, copy: bool = True) -> np.ndarray:
+    """
+    Converts the given precipitation values to a read-only two dimensional float
+    array, with one row per timestep and one column per station.
+
+    The values are copied by default, so changing the given values afterwards does
+    not change the converted array.
+
+    Args:
+        value (Any): Rows of precipitation values.
+        copy (bool, optional): Whether a given float array is copied. This should
+            only be disabled when the array is not used by anything else.
+            Defaults to True.
+
+    Raises:
+        ValueError: If the value cannot be converted to a two dimensional
+            float array.
+
+    Returns:
+        np.ndarray: The converted precipitation values.
+    """
+    if copy:
+        precipitations = np.array(value, dtype=np.float64)
+    else:
+        precipitations = np.asarray(value, dtype=np.float64)
+    if precipitations.size == 0 and precipitations.ndim < 2:
+        precipitations = precipitations.reshape(0, 0)
+    elif precipitations.ndim != 2:
+        raise ValueError(
+            "precipitations should be given as one row of values per timestep"
+        )
+    precipitations.flags.writeable = False
+    return precipitations
+
+
+@dataclass(frozen=True, eq=False)
+class BuiPrecipitationEvent:
+    """
+    A single precipitation event of a .bui file.
+
+    The event is an immutable data container instead of a pydantic model, as a
+    file can contain many of them. The values are converted to their field types
+    on construction, the precipitation values are copied into a read-only array.
+    Events of parsed values take over the parsed array instead of copying it.
+    """
+
+    __slots__ = ("start_time", "timeseries_length", "precipitation_per_timestep")
+
     start_time: datetime
     timeseries_length: timedelta
-    precipitation_per_timestep: List[List[float]]
+    precipitation_per_timestep: np.ndarray
+
+    def __post_init__(self) -> None:
+        self._convert_values(copy=True)
+
+    @classmethod
+    def _from_parsed(
+        cls,
+        start_time: datetime,
+        timeseries_length: timedelta,
+        precipitation_per_timestep: np.ndarray,
+    ) -> "BuiPrecipitationEvent":
+        # Creates an event which takes over the given precipitation array, which
+        # should not be used by anything else, such as an array that was just parsed.
+        event = cls.__new__(cls)
+        object.__setattr__(event, "start_time", start_time)
+        object.__setattr__(event, "timeseries_length", timeseries_length)
+        object.__setattr__(
+            event, "precipitation_per_timestep", precipitation_per_timestep
+        )
+        event._convert_values(copy=False)
+        return event
+
+    def _convert_values(self, copy: bool) -> None:
+        # The dataclass is frozen, so the converted values are set on the object.
+        object.__setattr__(self, "start_time", parse_datetime(self.start_time))
+        object.__setattr__(
+            self, "timeseries_length", parse_duration(self.timeseries_length)
+        )
+        object.__setattr__(
+            self,
+            "precipitation_per_timestep",
+            _to_precipitation_array(self.precipitation_per_timestep, copy=copy),
+        )
+
+    def __reduce__(self):
+        # Slotted frozen objects cannot restore their state with setattr. The
+        # unpickled array is not used by anything else, so it is taken over.
+        return (
+            self._from_parsed,
+            (self.start_time, self.timeseries_length, self.precipitation_per_timestep),
+        )
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict) -> None:
+        field_schema.update(
+            type="object",
+            properties={
+                "start_time": {"type": "string", "format": "date-time"},
+                "timeseries_length": {"type": "number", "format": "time-delta"},
+                "precipitation_per_timestep": {
+                    "type": "array",
+                    "items": {"type": "array", "items": {"type": "number"}},
+                },
+            },
+            required=["start_time", "timeseries_length", "precipitation_per_timestep"],
+        )
+
+    @classmethod
+    def validate(cls, value: Any) -> "BuiPrecipitationEvent":
+        """
+        Validates the given value and converts it to a BuiPrecipitationEvent.
+
+        Args:
+            value (Any): A BuiPrecipitationEvent or a mapping of its field values.
+
+        Raises:
+            TypeError: If the value is neither an event nor a mapping.
+
+        Returns:
+            BuiPrecipitationEvent: The validated event.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, Mapping):
+            return cls(**value)
+        raise TypeError("value should be a BuiPrecipitationEvent or a mapping")
+
+    def dict(self) -> Dict[str, Any]:
+        """
+        Gets the field values of this event as plain data, with the precipitation
+        per timestep as nested lists.
+
+        Returns:
+            Dict[str, Any]: The field values by field name.
+        """
+        return {
+            "start_time": self.start_time,
+            "timeseries_length": self.timeseries_length,
+            "precipitation_per_timestep": self.precipitation_per_timestep.tolist(),
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BuiPrecipitationEvent):
+            return NotImplemented
+        return (
+            self.start_time == other.start_time
+            and self.timeseries_length == other.timeseries_length
+            and np.array_equal(
+                self.precipitation_per_timestep, other.precipitation_per_timestep
+            )
+        )
 
     def get_station_precipitations(
         self, station_idx: int
@@ -33,7 +190,7 @@ class BuiPrecipitationEvent(BaseModel):
         Returns:
             Tuple[datetime, List[float]]: Tuple with the start time and its precipitations.
         """
-        number_of_stations = len(self.precipitation_per_timestep[0])
+        number_of_stations = self.precipitation_per_timestep.shape[1]
         if station_idx >= number_of_stations:
             raise ValueError(
                 "Station index not found, number of stations: {}".format(
@@ -42,16 +199,76 @@ class BuiPrecipitationEvent(BaseModel):
             )
         return (
             self.start_time,
-            [
-                ts_precipitations[station_idx]
-                for ts_precipitations in self.precipitation_per_timestep
-            ],
+            self.precipitation_per_timestep[:, station_idx].tolist(),
         )
 
 
+class BuiPrecipitationEventSequence(BuiEventSequence):
+    """
+    The precipitation events of a .bui file, which are parsed into
+    BuiPrecipitationEvent objects when they are accessed.
+
+    A BuiModel loads all its events when it is read from file, this sequence can
+    be used instead to only parse the events in use, see `from_file`.
+    """
+
+    @classmethod
+    def from_file(cls, filepath: Path) -> "BuiPrecipitationEventSequence":
+        """
+        Gets the precipitation events of the given .bui file without parsing them yet.
+
+        The file should not be changed or removed while the events are used.
+
+        Args:
+            filepath (Path): Path to the .bui file.
+
+        Returns:
+            BuiPrecipitationEventSequence: The precipitation events of the file.
+        """
+        return cls.from_sequence(BuiParser.lazy_events(filepath))
+
+    def _create_event(self, event_values: Dict) -> BuiPrecipitationEvent:
+        return BuiPrecipitationEvent._from_parsed(**event_values)
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict) -> None:
+        event_schema: Dict = {}
+        BuiPrecipitationEvent.__modify_schema__(event_schema)
+        field_schema.update(type="array", items=event_schema)
+
+    @classmethod
+    def validate(cls, value: Any) -> "BuiPrecipitationEventSequence":
+        """
+        Validates the given value and converts it to a BuiPrecipitationEventSequence.
+
+        Args:
+            value (Any): A sequence of the events of a .bui file.
+
+        Raises:
+            TypeError: If the value is not a BuiEventSequence.
+
+        Returns:
+            BuiPrecipitationEventSequence: The validated sequence.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, BuiEventSequence):
+            return cls.from_sequence(value)
+        raise TypeError("value should be a BuiEventSequence")
+
+
 class BuiModel(ParsableFileModel):
     """
     Model that represents the file structure of a .bui file.
+
+    When the precipitation events are a BuiPrecipitationEventSequence of the file
+    the model is saved to, the events are loaded into a list which replaces the
+    sequence before the file is written, as the sequence cannot be used once its
+    file has changed.
     """
 
     default_dataset: int = 1  # Default value (always)
@@ -59,7 +276,94 @@ class BuiModel(ParsableFileModel):
     name_of_stations: List[str]
     number_of_events: int
     seconds_per_timestep: int
-    precipitation_events: List[BuiPrecipitationEvent]
+    precipitation_events: Union[
+        List[BuiPrecipitationEvent], BuiPrecipitationEventSequence
+    ]
+
+    # The BuiParser already converts all values to their field types.
+    _trusted_load = True
+
+    class Config:
+        json_encoders = {
+            BuiPrecipitationEvent: lambda event: event.dict(),
+            BuiEventSequence: list,
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        # The default pydantic comparison converts both models to dictionaries,
+        # which cannot be compared when they contain numpy arrays.
+        if not isinstance(other, BuiModel):
+            return NotImplemented
+        field_names = self.__fields__.keys() - self._exclude_fields()
+        return all(getattr(self, name) == getattr(other, name) for name in field_names)
+
+    def dict(self, *args, **kwargs):
+        data = super().dict(*args, **kwargs)
+        # The events are no pydantic models, so they are converted separately.
+        if "precipitation_events" in data:
+            data["precipitation_events"] = [
+                event.dict() for event in self.precipitation_events
+            ]
+        return data
+
+    def _save(self, save_settings: ModelSaveSettings) -> None:
+        # The serializer accepts the events as models, so only a shallow copy of the
+        # fields is needed instead of converting the whole model tree with dict().
+        events = self.precipitation_events
+        write_path = self._resolved_filepath
+        if (
+            isinstance(events, BuiEventSequence)
+            and write_path is not None
+            and write_path.is_file()
+            and events.filepath.is_file()
+            and write_path.samefile(events.filepath)
+        ):
+            # Overwriting the file would invalidate the lazily parsed events.
+            self.precipitation_events = list(events)
+
+        excluded_fields = self._exclude_fields()
+        data = {name: value for name, value in self if name not in excluded_fields}
+        self._serialize(data, save_settings)
+
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """
+        Removes the parsed .bui files that are kept in memory.
+
+        When the HYDROLIB_CACHE_PARSE setting is enabled, the values of the most
+        recently parsed .bui files are kept in memory, so loading an unchanged file
+        again does not reparse it. This frees the memory used by these values.
+        """
+        _parse_cached.cache_clear()
+
+    @classmethod
+    def _parse_with_cache(cls, filepath: Path) -> Dict:
+        # The parsed values are also kept in memory per model type, file path,
+        # modification time and size, which is checked before the cache file. Only
+        # the containers are copied, the cached events are immutable.
+        stat = filepath.stat()
+        parsed = _parse_cached(
+            cls, str(filepath.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        return dict(
+            parsed,
+            name_of_stations=list(parsed["name_of_stations"]),
+            precipitation_events=list(parsed["precipitation_events"]),
+        )
+
+    @classmethod
+    def _parse(cls, path: Path) -> Dict:
+        data = super()._parse(path)
+        events: List[BuiPrecipitationEvent] = []
+        try:
+            for event_values in data["precipitation_events"]:
+                events.append(BuiPrecipitationEvent._from_parsed(**event_values))
+        except ValueError as error:
+            raise ValidationError(
+                [ErrorWrapper(error, loc=("precipitation_events", len(events)))], cls
+            ) from error
+        data["precipitation_events"] = events
+        return data
 
     @classmethod
     def _filename(cls):
@@ -100,3 +404,15 @@ class BuiModel(ParsableFileModel):
             start_time, precipitations = event.get_station_precipitations(station_idx)
             station_events[start_time] = precipitations
         return station_events
+
+
+@lru_cache(maxsize=8)
+def _parse_cached(
+    model_type: Type[BuiModel], filepath: str, mtime_ns: int, size: int
+) -> Dict:
+    # The modification time and size are only part of the cache key, so a changed
+    # file results in a cache miss. A miss is looked up in the cache file next.
+    data = super(BuiModel, model_type)._parse_with_cache(Path(filepath))
+    data["name_of_stations"] = tuple(data["name_of_stations"])
+    data["precipitation_events"] = tuple(data["precipitation_events"])
+    return data
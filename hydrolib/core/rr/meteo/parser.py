@@ -1,6 +1,32 @@
+import mmap
+import os
+import re
+from collections.abc import Sequence
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Iterator, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+# The buffers in which the precipitation events are looked up.
+_Buffer = Union[bytes, mmap.mmap]
+
+# The header of a .bui file: the default dataset, the number of stations, the names
+# of the stations and the number of events with the seconds per timestep, each on
+# its own line and optionally preceded by comment lines. The line with the number of
+# events and seconds per timestep may contain other values after these.
+_COMMENT_LINES = rb"(?:\*[^\n]*\n)*"
+_HEADER_RE = re.compile(
+    _COMMENT_LINES
+    + rb"[ \t]*(\d+)[ \t]*\r?\n"
+    + _COMMENT_LINES
+    + rb"[ \t]*(\d+)[ \t]*\r?\n"
+    + _COMMENT_LINES
+    + rb"([^\r\n]*)\r?\n"
+    + _COMMENT_LINES
+    + rb"[ \t]*(\d+)[ \t]+(\d+)(?:[ \t][^\r\n]*)?(?:\r?\n|\Z)"
+)
 
 
 class BuiEventParser:
@@ -30,19 +56,47 @@ class BuiEventParser:
             Dict: Mapped contents of the text.
         """
 
-        def get_precipitations_per_ts(line: str) -> List[str]:
-            return [prec for prec in line.split()]
-
-        event_lines = raw_text.splitlines(keepends=False)
-        time_reference = BuiEventParser.parse_event_time_reference(event_lines[0])
+        time_reference_line, _, precipitations_text = raw_text.partition("\n")
+        time_reference = BuiEventParser.parse_event_time_reference(time_reference_line)
         return dict(
             start_time=time_reference["start_time"],
             timeseries_length=time_reference["timeseries_length"],
-            precipitation_per_timestep=list(
-                map(get_precipitations_per_ts, event_lines[1:])
+            precipitation_per_timestep=BuiEventParser.parse_precipitation_per_timestep(
+                precipitations_text
             ),
         )
 
+    @staticmethod
+    def parse_precipitation_per_timestep(raw_text: str) -> np.ndarray:
+        """
+        Parses the precipitation lines of an event into a two dimensional array,
+        with one row per timestep (line) and one column per station.
+
+        Args:
+            raw_text (str): Lines of whitespace separated precipitation values.
+
+        Raises:
+            ValueError: If a value is not a valid number or when the lines do not
+                contain the same number of values.
+
+        Returns:
+            np.ndarray: Array of shape (number of timesteps, number of stations).
+        """
+        raw_text = raw_text.strip()
+        if not raw_text:
+            return np.empty((0, 0), dtype=np.float64)
+
+        rows = [line.split() for line in raw_text.split("\n")]
+        n_stations = len(rows[0])
+        for n_timestep, row in enumerate(rows):
+            if len(row) != n_stations:
+                raise ValueError(
+                    f"Expected {n_stations} precipitation values for each timestep, "
+                    f"but timestep {n_timestep + 1} has {len(row)}."
+                )
+        # Convert all values at once, the string to float conversion is done by numpy.
+        return np.array(rows, dtype=np.float64)
+
     @staticmethod
     def parse_event_time_reference(raw_text: str) -> Dict:
         """
@@ -107,27 +161,13 @@ class BuiEventListParser:
             List[Dict]: List containing all the events represented as dictionaries.
         """
 
-        def get_event_timestep_length(raw_line: str) -> int:
-            timereference = BuiEventParser.parse_event_time_reference(raw_line)
-            ts_length: timedelta = timereference["timeseries_length"]
-            return ts_length.total_seconds()
-
-        def get_multiple_events(raw_lines: List[str]) -> Iterator[BuiEventParser]:
-            n_line = 0
-            while n_line < len(raw_lines):
-                ts_seconds = get_event_timestep_length(raw_lines[n_line])
-                event_lines = int(ts_seconds / timestep) + 1
-                yield BuiEventParser.parse("\n".join(raw_lines[n_line:][:event_lines]))
-                n_line += event_lines
-
-        event_list = []
-        if n_events == 1:
-            event_list.append(BuiEventParser.parse(raw_text))
-        elif n_events > 1:
-            raw_lines = raw_text.splitlines(keepends=False)
-            event_list = list(get_multiple_events(raw_lines))
-
-        return event_list
+        # The events are found the same way as in the files read by BuiParser.
+        return [
+            BuiEventParser.parse(event_text)
+            for event_text in _iter_event_texts(
+                raw_text.encode("utf8"), 0, n_events, timestep
+            )
+        ]
 
 
 class BuiParser:
@@ -155,32 +195,295 @@ class BuiParser:
         Args:
             filepath (Path): Path to file containing the data to parse.
 
+        Raises:
+            ValueError: If the file does not start with a valid header or when
+                a precipitation event cannot be parsed.
+
         Returns:
             Dict: Parsed values.
         """
+        buffer = filepath.read_bytes()
+        parsed, events_offset = _parse_header(filepath, buffer)
+        event_texts = _iter_event_texts(
+            buffer,
+            events_offset,
+            parsed["number_of_events"],
+            parsed["seconds_per_timestep"],
+        )
+        events = []
+        for n_event, event_text in enumerate(event_texts):
+            try:
+                events.append(BuiEventParser.parse(event_text))
+            except ValueError as error:
+                raise ValueError(
+                    f"File: `{filepath}`, precipitation event {n_event + 1}: {error}"
+                ) from error
+        parsed["precipitation_events"] = events
+        return parsed
 
-        def get_station_ids(line: str) -> List[str]:
-            return [s_id for s_id in line.split(",")]
+    @staticmethod
+    def lazy_events(filepath: Path) -> "BuiEventSequence":
+        """
+        Gets the precipitation events of a given file without parsing them yet.
 
-        def parse_events_and_timestep(line: str) -> Tuple[int, int]:
-            n_events_timestep = line.split()
-            return (int(n_events_timestep[0]), int(n_events_timestep[1]))
+        Only the header of the file is parsed directly. Each event is parsed from
+        the file when it is accessed, so only the events in use need to be held
+        in memory.
 
-        bui_lines = [
-            line
-            for line in filepath.read_text(encoding="utf8").splitlines()
-            if not line.startswith("*")
-        ]
+        Args:
+            filepath (Path): Path to the .bui file.
 
-        n_events, timestep = parse_events_and_timestep(bui_lines[3])
+        Raises:
+            ValueError: If the file does not start with a valid header.
 
-        return dict(
-            default_dataset=bui_lines[0],
-            number_of_stations=bui_lines[1],
-            name_of_stations=get_station_ids(bui_lines[2]),
-            number_of_events=n_events,
-            seconds_per_timestep=timestep,
-            precipitation_events=BuiEventListParser.parse(
-                "\n".join(bui_lines[4:]), n_events, timestep
-            ),
+        Returns:
+            BuiEventSequence: The precipitation events of the file.
+        """
+        with filepath.open("rb") as bui_file:
+            stat = os.fstat(bui_file.fileno())
+            if stat.st_size == 0:
+                parsed, events_offset = _parse_header(filepath, b"")
+            else:
+                with mmap.mmap(
+                    bui_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as bui_map:
+                    parsed, events_offset = _parse_header(filepath, bui_map)
+
+        return BuiEventSequence(
+            filepath,
+            events_offset,
+            parsed["number_of_events"],
+            parsed["seconds_per_timestep"],
+            (stat.st_mtime_ns, stat.st_size),
+        )
+
+
+class BuiEventSequence(Sequence):
+    """
+    A sequence of the precipitation events of a .bui file, which are parsed when
+    they are accessed.
+
+    Only the location of the events within the file is kept in memory. An event
+    is parsed from a memory map of the file every time it is accessed, the offsets
+    of the events are indexed along the way. The file is opened for each access,
+    also while iterating, and is not held open in between. Accessing the events
+    raises a ValueError when the file has changed after it was parsed.
+    """
+
+    def __init__(
+        self,
+        filepath: Path,
+        events_offset: int,
+        number_of_events: int,
+        seconds_per_timestep: int,
+        file_stamp: Tuple[int, int],
+    ) -> None:
+        """
+        Creates a new sequence of the events within the given file.
+
+        Args:
+            filepath (Path): Path to the .bui file.
+            events_offset (int): Byte offset of the first event within the file.
+            number_of_events (int): Number of events within the file.
+            seconds_per_timestep (int): Number of seconds conforming a timestep.
+            file_stamp (Tuple[int, int]): Modification time in nanoseconds and size
+                of the file when it was parsed.
+        """
+        self.filepath = filepath
+        self._events_offset = events_offset
+        self._number_of_events = number_of_events
+        self._seconds_per_timestep = seconds_per_timestep
+        self._file_stamp = file_stamp
+        self._event_spans: List[Tuple[int, int]] = []
+
+    @classmethod
+    def from_sequence(cls, other: "BuiEventSequence") -> "BuiEventSequence":
+        """
+        Creates a sequence of this type over the same events as the given sequence.
+
+        Args:
+            other (BuiEventSequence): The sequence of which to take the events.
+
+        Returns:
+            BuiEventSequence: The new sequence.
+        """
+        return cls(*other._arguments())
+
+    def _arguments(self) -> Tuple:
+        return (
+            self.filepath,
+            self._events_offset,
+            self._number_of_events,
+            self._seconds_per_timestep,
+            self._file_stamp,
+        )
+
+    def __reduce__(self):
+        return (self.__class__, self._arguments())
+
+    def __len__(self) -> int:
+        return self._number_of_events
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            if not indices:
+                return []
+            with self._open() as bui_map:
+                return [self._get_event(bui_map, i) for i in indices]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("precipitation event index out of range")
+        with self._open() as bui_map:
+            return self._get_event(bui_map, index)
+
+    def __iter__(self) -> Iterator[Any]:
+        # Every event is accessed on its own, so the file is not held open while
+        # the iteration is suspended.
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BuiEventSequence) and (
+            self._arguments() == other._arguments()
+        ):
+            return True
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            event == other_event for event, other_event in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}('{self.filepath}', "
+            f"number_of_events={len(self)})"
+        )
+
+    def _create_event(self, event_values: Dict) -> Any:
+        """
+        Creates the object returned for a parsed event, subclasses can override this
+        to return something else than the dictionary of the BuiEventParser.
+        """
+        return event_values
+
+    @contextmanager
+    def _open(self) -> Iterator[mmap.mmap]:
+        with self.filepath.open("rb") as bui_file:
+            stat = os.fstat(bui_file.fileno())
+            if (stat.st_mtime_ns, stat.st_size) != self._file_stamp:
+                raise ValueError(
+                    f"File: `{self.filepath}` has changed since its precipitation "
+                    "events were parsed."
+                )
+            with mmap.mmap(bui_file.fileno(), 0, access=mmap.ACCESS_READ) as bui_map:
+                yield bui_map
+
+    def _get_event(self, bui_map: mmap.mmap, index: int) -> Any:
+        while len(self._event_spans) <= index:
+            offset = (
+                self._event_spans[-1][1] if self._event_spans else self._events_offset
+            )
+            span = _find_event_span(
+                bui_map, offset, self._number_of_events, self._seconds_per_timestep
+            )
+            if span is None:
+                raise ValueError(
+                    f"File: `{self.filepath}` contains less than {len(self)} "
+                    "precipitation events."
+                )
+            self._event_spans.append(span)
+
+        start, end = self._event_spans[index]
+        try:
+            return self._create_event(
+                BuiEventParser.parse(_decode_event(bui_map, start, end))
+            )
+        except ValueError as error:
+            raise ValueError(
+                f"File: `{self.filepath}`, precipitation event {index + 1}: {error}"
+            ) from error
+
+
+def _parse_header(filepath: Path, buffer: _Buffer) -> Tuple[Dict, int]:
+    # Gets the values of the header of the given .bui file contents and the offset
+    # of the first precipitation event.
+    match = _HEADER_RE.match(buffer)
+    if match is None:
+        raise ValueError(f"File: `{filepath}` does not start with a valid header.")
+
+    dataset, n_stations, station_ids, n_events, timestep = match.groups()
+    parsed = dict(
+        default_dataset=int(dataset),
+        number_of_stations=int(n_stations),
+        name_of_stations=station_ids.decode("utf8").split(","),
+        number_of_events=int(n_events),
+        seconds_per_timestep=int(timestep),
+    )
+    return parsed, match.end()
+
+
+def _iter_event_texts(
+    buffer: _Buffer, offset: int, number_of_events: int, seconds_per_timestep: int
+) -> Iterator[str]:
+    # Gets the text of each precipitation event following the given offset in the
+    # buffer, without its comment lines.
+    for _ in range(number_of_events):
+        span = _find_event_span(buffer, offset, number_of_events, seconds_per_timestep)
+        if span is None:
+            return
+        start, offset = span
+        yield _decode_event(buffer, start, offset)
+
+
+def _find_event_span(
+    buffer: _Buffer, offset: int, number_of_events: int, seconds_per_timestep: int
+) -> Optional[Tuple[int, int]]:
+    # Gets the start and end offset of the event following the given offset in the
+    # buffer, or None when the buffer contains no more events.
+    start = _skip_comment_lines(buffer, offset, skip_blank_lines=True)
+    if start == len(buffer):
+        return None
+
+    # A single event takes up the remainder of the buffer.
+    if number_of_events == 1:
+        return start, len(buffer)
+
+    offset = _next_line_offset(buffer, start)
+    time_reference = BuiEventParser.parse_event_time_reference(
+        buffer[start:offset].decode("utf8")
+    )
+    ts_seconds = time_reference["timeseries_length"].total_seconds()
+    for _ in range(int(ts_seconds / seconds_per_timestep)):
+        offset = _next_line_offset(buffer, _skip_comment_lines(buffer, offset))
+    return start, offset
+
+
+def _decode_event(buffer: _Buffer, start: int, end: int) -> str:
+    event_text = buffer[start:end].decode("utf8")
+    if "*" in event_text:
+        event_text = "\n".join(
+            line for line in event_text.splitlines() if not line.startswith("*")
         )
+    return event_text
+
+
+def _next_line_offset(buffer: _Buffer, offset: int) -> int:
+    line_end = buffer.find(b"\n", offset)
+    return len(buffer) if line_end < 0 else line_end + 1
+
+
+def _skip_comment_lines(
+    buffer: _Buffer, offset: int, skip_blank_lines: bool = False
+) -> int:
+    while offset < len(buffer):
+        next_offset = _next_line_offset(buffer, offset)
+        is_comment = buffer[offset] == ord("*")
+        if not is_comment and not (
+            skip_blank_lines and not buffer[offset:next_offset].strip()
+        ):
+            return offset
+        offset = next_offset
+    return offset
@@ -1,7 +1,12 @@
 import inspect
+import io
+from dataclasses import fields
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List, Mapping, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from hydrolib.core.basemodel import ModelSaveSettings, SerializerConfig
 
@@ -21,6 +26,9 @@ class BuiEventSerializer:
         {precipitation_per_timestep}
     """
     )
+    # The template without the precipitations, which are written to the output
+    # separately so their (large) text block is not copied into the formatted event.
+    _heading_template = bui_event_template.partition("{precipitation_per_timestep}")[0]
 
     @staticmethod
     def serialize(event_data: Dict, config: SerializerConfig) -> str:
@@ -34,6 +42,14 @@ class BuiEventSerializer:
         Returns:
             str: Formatted string.
         """
+        buffer = io.StringIO()
+        BuiEventSerializer._write_event(buffer, event_data, config)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _write_event(
+        buffer: io.StringIO, event_data: Dict, config: SerializerConfig
+    ) -> None:
         event_data["start_time"] = BuiEventSerializer.serialize_start_time(
             event_data["start_time"]
         )
@@ -47,14 +63,13 @@ class BuiEventSerializer:
         ] = BuiEventSerializer.serialize_timeseries_length(
             event_data["timeseries_length"]
         )
-        event_data[
-            "precipitation_per_timestep"
-        ] = BuiEventSerializer.serialize_precipitation_per_timestep(
-            event_data["precipitation_per_timestep"], config
-        )
+        precipitations = event_data.pop("precipitation_per_timestep")
         if "event_idx" not in event_data.keys():
             event_data["event_idx"] = 1
-        return BuiEventSerializer.bui_event_template.format(**event_data)
+        buffer.write(BuiEventSerializer._heading_template.format(**event_data))
+        BuiEventSerializer._write_precipitation_per_timestep(
+            buffer, precipitations, config
+        )
 
     @staticmethod
     def get_timedelta_fields(duration: timedelta) -> Dict:
@@ -69,11 +84,8 @@ class BuiEventSerializer:
         Returns:
             Dict: Dictionary containing all fields.
         """
-        total_hours = int(duration.seconds / (60 * 60))
-        total_minutes = int((duration.seconds / 60) - (total_hours * 60))
-        total_seconds = int(
-            duration.seconds - ((total_hours * 60 + total_minutes) * 60)
-        )
+        total_hours, remainder = divmod(duration.seconds, 3600)
+        total_minutes, total_seconds = divmod(remainder, 60)
         return dict(
             d_seconds=total_seconds,
             d_minutes=total_minutes,
@@ -109,36 +121,45 @@ class BuiEventSerializer:
         Returns:
             str: Converted timedelta in string.
         """
-        fields_dict = BuiEventSerializer.get_timedelta_fields(data_to_serialize)
-        total_hours = fields_dict["d_hours"]
-        total_minutes = fields_dict["d_minutes"]
-        total_seconds = fields_dict["d_seconds"]
-        return f"{data_to_serialize.days} {total_hours} {total_minutes} {total_seconds}"
+        total_seconds = data_to_serialize.days * 86400 + data_to_serialize.seconds
+        days, remainder = divmod(total_seconds, 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{days} {hours} {minutes} {seconds}"
 
     @staticmethod
     def serialize_precipitation_per_timestep(
-        data_to_serialize: List[List[float]], config: SerializerConfig
+        data_to_serialize: ArrayLike, config: SerializerConfig
     ) -> str:
         """
         Serialized the data containing all the precipitations per timestep (and station)
         into a single string ready to be mapped.
 
         Args:
-            data_to_serialize (List[List[str]]): Data to be mapped.
+            data_to_serialize (ArrayLike): Data to be mapped, one row per timestep.
             config (SerializerConfig): The serialization configuration.
 
         Returns:
             str: Serialized string in .bui format.
         """
-        float_format = lambda v: f"{v:{config.float_format}}"
-        serialized_data = str.join(
-            "\n",
-            [
-                str.join(" ", map(float_format, listed_data))
-                for listed_data in data_to_serialize
-            ],
+        buffer = io.StringIO()
+        BuiEventSerializer._write_precipitation_per_timestep(
+            buffer, data_to_serialize, config
         )
-        return serialized_data
+        return buffer.getvalue()
+
+    @staticmethod
+    def _write_precipitation_per_timestep(
+        buffer: io.StringIO, data_to_serialize: ArrayLike, config: SerializerConfig
+    ) -> None:
+        precipitations = np.atleast_2d(np.asarray(data_to_serialize, dtype=np.float64))
+        # Each row is converted and formatted on its own and written straight to the
+        # buffer, so the values and text of the whole block are never held at once.
+        row_format = " ".join([f"{{:{config.float_format}}}"] * precipitations.shape[1])
+        for n_row, row in enumerate(precipitations):
+            if n_row > 0:
+                buffer.write("\n")
+            buffer.write(row_format.format(*row.tolist()))
 
 
 class BuiSerializer:
@@ -146,26 +167,10 @@ class BuiSerializer:
     Serializer class to transform an object into a .bui file text format.
     """
 
-    bui_template = inspect.cleandoc(
-        """
-        *Name of this file: {filepath}
-        *Date and time of construction: {datetime_now}
-        *Comments are following an * (asterisk) and written above variables
-        {default_dataset}
-        *Number of stations
-        {number_of_stations}
-        *Station Name
-        {name_of_stations}
-        *Number_of_events seconds_per_timestamp
-        {number_of_events} {seconds_per_timestep}
-        {precipitation_events}
-        """
-    )
-
     @staticmethod
     def serialize(bui_data: Dict, config: SerializerConfig) -> str:
         """
-        Formats the bui_template with the content of the given data.
+        Formats the content of the given data into the .bui file text format.
         NOTE: It requires that caller injects file_path into bui_data prior to this call.
         Otherwise it will crash.
 
@@ -176,34 +181,67 @@ class BuiSerializer:
         Returns:
             str: The serialized data.
         """
-        bui_data["datetime_now"] = datetime.now().strftime("%d-%m-%y %H:%M:%S")
-        bui_data["name_of_stations"] = BuiSerializer.serialize_stations_ids(
+        datetime_now = datetime.now().strftime("%d-%m-%y %H:%M:%S")
+        name_of_stations = BuiSerializer.serialize_stations_ids(
             bui_data["name_of_stations"]
         )
-        bui_data["precipitation_events"] = BuiSerializer.serialize_event_list(
-            bui_data["precipitation_events"], config
+
+        buffer = io.StringIO()
+        buffer.write(
+            f"*Name of this file: {bui_data['filepath']}\n"
+            f"*Date and time of construction: {datetime_now}\n"
+            "*Comments are following an * (asterisk) and written above variables\n"
+            f"{bui_data['default_dataset']}\n"
+            "*Number of stations\n"
+            f"{bui_data['number_of_stations']}\n"
+            "*Station Name\n"
+            f"{name_of_stations}\n"
+            "*Number_of_events seconds_per_timestamp\n"
+            f"{bui_data['number_of_events']} {bui_data['seconds_per_timestep']}\n"
+        )
+        BuiSerializer._write_event_list(
+            buffer, bui_data["precipitation_events"], config
         )
-        return BuiSerializer.bui_template.format(**bui_data)
+        return buffer.getvalue()
 
     @staticmethod
     def serialize_event_list(
-        data_to_serialize: List[Dict], config: SerializerConfig
+        data_to_serialize: Iterable[Union[Dict, Any]], config: SerializerConfig
     ) -> str:
         """
-        Serializes a event list dictionary into a single text block.
+        Serializes a event list into a single text block.
 
         Args:
-            data_to_serialize (Dict): Dictionary containing list of events.
+            data_to_serialize (Iterable[Union[Dict, Any]]): The events, either
+                as dictionaries or as BuiPrecipitationEvent instances.
             config (SerializerConfig): The serialization configuration.
 
         Returns:
             str: Text block representing all precipitation events.
         """
-        serialized_list = []
+        buffer = io.StringIO()
+        BuiSerializer._write_event_list(buffer, data_to_serialize, config)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _write_event_list(
+        buffer: io.StringIO,
+        data_to_serialize: Iterable[Union[Dict, Any]],
+        config: SerializerConfig,
+    ) -> None:
         for n_event, event in enumerate(data_to_serialize):
-            event["event_idx"] = n_event + 1
-            serialized_list.append(BuiEventSerializer.serialize(event, config))
-        return "\n".join(serialized_list)
+            if n_event > 0:
+                buffer.write("\n")
+            if isinstance(event, Mapping):
+                event_data = dict(event, event_idx=n_event + 1)
+            else:
+                # Collect the field values of the event dataclass, without the deep
+                # copy that dataclasses.asdict makes of the precipitation arrays.
+                event_data = {
+                    field.name: getattr(event, field.name) for field in fields(event)
+                }
+                event_data["event_idx"] = n_event + 1
+            BuiEventSerializer._write_event(buffer, event_data, config)
 
     @staticmethod
     def serialize_stations_ids(data_to_serialize: List[str]) -> str:
@@ -227,7 +265,8 @@ def write_bui_file(
 
     Args:
         path (Path): Path where to output the text.
-        data (Dict): Data to serialize into the file.
+        data (Dict): Data to serialize into the file. The precipitation events
+            can be given either as dictionaries or as BuiPrecipitationEvent instances.
         config (SerializerConfig): The serialization configuration.
         save_settings (ModelSaveSettings): The model save settings.
     """
@@ -235,4 +274,5 @@ def write_bui_file(
     serialized_bui_data = BuiSerializer.serialize(data, config)
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(serialized_bui_data, encoding="utf8")
+    # The file is encoded as a whole and written with a single write call.
+    path.write_bytes(serialized_bui_data.encode("utf8"))
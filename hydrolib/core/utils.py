@@ -1,5 +1,6 @@
 import platform
 import re
+import sys
 from enum import Enum, auto
 from operator import eq, ge, gt, le, lt, ne
 from pathlib import Path
@@ -51,7 +52,8 @@ def to_key(string: str) -> str:
         string = digitstring + string[m.end() :]
 
     # Next, replace spaces and hyphens in the potential variable name.
-    return string.lower().replace(" ", "_").replace("-", "")
+    # The key is interned, as it is used to look up fields and parsed values.
+    return sys.intern(string.lower().replace(" ", "_").replace("-", ""))
 
 
 def to_list(item: Any) -> List[Any]:
@@ -1,17 +1,34 @@
 import inspect
+import json
+import os
+import pickle
+import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pytest
+from pydantic.error_wrappers import ValidationError
 
 from hydrolib.core.basemodel import ModelSaveSettings, SerializerConfig
-from hydrolib.core.rr.meteo.models import BuiModel, BuiPrecipitationEvent
-from hydrolib.core.rr.meteo.parser import BuiEventListParser, BuiEventParser, BuiParser
+from hydrolib.core.config import settings
+from hydrolib.core.rr.meteo.models import (
+    BuiModel,
+    BuiPrecipitationEvent,
+    BuiPrecipitationEventSequence,
+)
+from hydrolib.core.rr.meteo.parser import (
+    BuiEventListParser,
+    BuiEventParser,
+    BuiEventSequence,
+    BuiParser,
+)
 from hydrolib.core.rr.meteo.serializer import (
     BuiEventSerializer,
     BuiSerializer,
     write_bui_file,
 )
+from hydrolib.core.rr.models import RainfallRunoffModel
 from tests.dflowfm.test_structure import (
     test_weir_and_universal_weir_resolve_from_parsed_document,
 )
@@ -123,6 +140,198 @@ class TestModel:
             assert model == BuiTestData.bui_model()
             assert model.filepath == test_file
 
+        def test_given_filepath_loads_values_of_field_types(self):
+            model = BuiModel(filepath=BuiTestData.default_bui_file())
+            assert isinstance(model.number_of_stations, int)
+            event = model.precipitation_events[0]
+            assert isinstance(event, BuiPrecipitationEvent)
+            assert isinstance(event.precipitation_per_timestep, np.ndarray)
+            assert event.precipitation_per_timestep.dtype == np.float64
+
+        def test_given_cache_parse_setting_and_same_file_twice_does_not_parse_again(
+            self, monkeypatch
+        ):
+            monkeypatch.setattr(settings, "HYDROLIB_CACHE_PARSE", True)
+            test_file = test_output_dir / "loaded_twice.bui"
+            shutil.copyfile(BuiTestData.default_bui_file(), test_file)
+            first_model = BuiModel(filepath=test_file)
+            # Only the values kept in memory remain.
+            cache_file = test_output_dir / (
+                f"loaded_twice.bui.{BuiModel.__module__}.BuiModel.pkl"
+            )
+            cache_file.unlink()
+
+            def parse(cls, filepath: Path):
+                raise AssertionError("The file should not be parsed again.")
+
+            monkeypatch.setattr(BuiModel, "_parse", classmethod(parse))
+            first_model.name_of_stations.append("extra_station")
+            first_model.precipitation_events.clear()
+            second_model = BuiModel(filepath=test_file)
+
+            assert second_model.name_of_stations == ["’Station1’"]
+            assert len(second_model.precipitation_events) == 1
+            event = second_model.precipitation_events[0]
+            assert not event.precipitation_per_timestep.flags.writeable
+
+            BuiModel.clear_parse_cache()
+            with pytest.raises(AssertionError):
+                BuiModel(filepath=test_file)
+            test_file.unlink()
+
+        def test_given_parsed_unknown_field_raises_validation_error(self, monkeypatch):
+            parse = BuiModel._parse
+
+            def parse_with_unknown_field(cls, filepath: Path):
+                return dict(parse(filepath), unknown_field=1)
+
+            monkeypatch.setattr(
+                BuiModel, "_parse", classmethod(parse_with_unknown_field)
+            )
+
+            with pytest.raises(ValidationError) as error:
+                BuiModel(filepath=BuiTestData.default_bui_file())
+
+            assert error.value.errors()[0]["loc"] == ("unknown_field",)
+
+        def test_given_filepath_and_field_values_validates_field_values(self):
+            test_file = test_output_dir / "validated_kwargs.bui"
+            shutil.copyfile(BuiTestData.default_bui_file(), test_file)
+
+            model = BuiModel(
+                filepath=test_file, serializer_config={"float_format": ".2f"}
+            )
+            model.save()
+
+            assert isinstance(model.serializer_config, SerializerConfig)
+            assert model.serializer_config.float_format == ".2f"
+            assert "0.20" in test_file.read_text(encoding="utf8")
+            test_file.unlink()
+
+        def test_given_cache_parse_setting_loads_from_pickled_file(self, monkeypatch):
+            expected_model = BuiTestData.bui_model()
+            monkeypatch.setattr(settings, "HYDROLIB_CACHE_PARSE", True)
+            test_file = test_output_dir / "cached.bui"
+            shutil.copyfile(BuiTestData.default_bui_file(), test_file)
+            cache_file = (
+                test_output_dir / f"cached.bui.{BuiModel.__module__}.BuiModel.pkl"
+            )
+
+            first_model = BuiModel(filepath=test_file)
+            assert cache_file.is_file()
+            second_model = BuiModel(filepath=test_file)
+
+            assert first_model == second_model == expected_model
+            test_file.unlink()
+            cache_file.unlink()
+
+        def test_given_cache_parse_setting_and_older_file_copied_over_loads_file(
+            self, monkeypatch
+        ):
+            monkeypatch.setattr(settings, "HYDROLIB_CACHE_PARSE", True)
+            default_text = BuiTestData.default_bui_file().read_text(encoding="utf8")
+            older_file = test_output_dir / "older.bui"
+            older_file.write_text(
+                default_text.replace("1 10800", "1 3600"), encoding="utf8"
+            )
+            os.utime(older_file, ns=(0, 0))
+            test_file = test_output_dir / "replaced.bui"
+            test_file.write_text(default_text, encoding="utf8")
+            assert BuiModel(filepath=test_file).seconds_per_timestep == 10800
+
+            shutil.copy2(older_file, test_file)
+
+            assert BuiModel(filepath=test_file).seconds_per_timestep == 3600
+            for path in test_output_dir.glob("replaced.bui*"):
+                path.unlink()
+            older_file.unlink()
+
+        def test_given_filepath_loads_all_events(self):
+            test_file = test_output_dir / "loaded_events.bui"
+            shutil.copyfile(BuiTestData.default_bui_file(), test_file)
+            model = BuiModel(filepath=test_file)
+            test_file.unlink()
+
+            events = model.precipitation_events
+            assert isinstance(events, list)
+            assert events[0] is events[0]
+            assert events == BuiTestData.bui_model().precipitation_events
+            events.append(events[0])
+            assert len(model.precipitation_events) == 2
+
+        def test_given_invalid_event_value_raises(self):
+            test_file = test_output_dir / "invalid_event.bui"
+            default_text = BuiTestData.default_bui_file().read_text(encoding="utf8")
+            test_file.write_text(default_text.replace("0.2\n", "abc\n", 1))
+
+            with pytest.raises(ValueError) as error:
+                BuiModel(filepath=test_file)
+
+            assert "precipitation event 1" in str(error.value)
+            assert "abc" in str(error.value)
+            test_file.unlink()
+
+        def test_json_contains_event_values(self):
+            model = BuiModel(filepath=BuiTestData.default_bui_file())
+
+            data = json.loads(model.json())
+
+            assert data["precipitation_events"] == [
+                {
+                    "start_time": "1996-01-01T00:00:00",
+                    "timeseries_length": 97200.0,
+                    "precipitation_per_timestep": [[0.2]] * 9,
+                }
+            ]
+            model.precipitation_events = BuiPrecipitationEventSequence.from_file(
+                BuiTestData.default_bui_file()
+            )
+            assert json.loads(model.json()) == data
+
+        def test_json_of_parent_model_contains_event_values(self):
+            bui_model = BuiModel(filepath=BuiTestData.default_bui_file())
+            model = RainfallRunoffModel(bui_file=bui_model)
+
+            data = json.loads(model.json())
+
+            assert (
+                data["bui_file"]["precipitation_events"]
+                == json.loads(bui_model.json())["precipitation_events"]
+            )
+
+        def test_dict_contains_event_values(self):
+            model = BuiTestData.bui_model()
+            event = model.precipitation_events[0]
+
+            events = model.dict()["precipitation_events"]
+
+            assert len(events) == 1
+            assert events[0]["start_time"] == event.start_time
+            assert events[0]["timeseries_length"] == event.timeseries_length
+            assert events[0]["precipitation_per_timestep"] == [[0.2]] * 9
+
+        def test_given_file_events_are_parsed_when_accessed(self):
+            events = BuiPrecipitationEventSequence.from_file(
+                BuiTestData.default_bui_file()
+            )
+            assert isinstance(events, BuiPrecipitationEventSequence)
+            assert events == BuiTestData.bui_model().precipitation_events
+            assert pickle.loads(pickle.dumps(events)) == events
+
+        def test_save_over_loaded_file_keeps_events(self):
+            test_file = test_output_dir / "overwritten.bui"
+            shutil.copyfile(BuiTestData.default_bui_file(), test_file)
+            model = BuiModel(filepath=test_file)
+            model.precipitation_events = BuiPrecipitationEventSequence.from_file(
+                test_file
+            )
+
+            model.save()
+
+            assert isinstance(model.precipitation_events, list)
+            assert model == BuiModel(filepath=test_file)
+            test_file.unlink()
+
         def test_save_default_verify_expected_text(self):
             # 1. Define test data.
             default_bui_model = BuiTestData.bui_model()
@@ -191,12 +400,25 @@ class TestModel:
             new_model = BuiModel(save_path)
             assert default_bui_model == new_model
 
-            def filtered_dict(input_dict: dict) -> dict:
-                return {k: v for k, v in input_dict.items() if k != "filepath"}
+            excluded_fields = BuiModel._exclude_fields() | {"precipitation_events"}
+            for name in BuiModel.__fields__:
+                if name not in excluded_fields:
+                    assert getattr(new_model, name) == getattr(
+                        default_bui_model, name
+                    ), name
 
-            assert filtered_dict(default_bui_model.dict()) == filtered_dict(
-                new_model.dict()
+            assert len(new_model.precipitation_events) == len(
+                default_bui_model.precipitation_events
             )
+            for default_event, new_event in zip(
+                default_bui_model.precipitation_events, new_model.precipitation_events
+            ):
+                assert default_event.start_time == new_event.start_time
+                assert default_event.timeseries_length == new_event.timeseries_length
+                assert np.array_equal(
+                    default_event.precipitation_per_timestep,
+                    new_event.precipitation_per_timestep,
+                )
 
         def test_get_station_events_given_valid_station(self):
             default_bui_model = BuiTestData.bui_model()
@@ -219,6 +441,75 @@ class TestModel:
         all the methods in the BuiPrecipitationEvent class.
         """
 
+        def test_given_nested_list_stores_precipitations_as_array(self):
+            event = BuiPrecipitationEvent(
+                start_time=datetime(1996, 1, 1),
+                timeseries_length=timedelta(seconds=120),
+                precipitation_per_timestep=[[0.2, 0.4], [0.6, 0.8], [1.0, 1.2]],
+            )
+            assert isinstance(event.precipitation_per_timestep, np.ndarray)
+            assert event.precipitation_per_timestep.shape == (3, 2)
+            assert event.precipitation_per_timestep.dtype == np.float64
+
+        def test_given_array_stores_read_only_copy_of_precipitations(self):
+            precipitations = np.array([[0.2, 0.4], [0.6, 0.8]])
+            event = BuiPrecipitationEvent(
+                start_time=datetime(1996, 1, 1),
+                timeseries_length=timedelta(seconds=120),
+                precipitation_per_timestep=precipitations,
+            )
+            precipitations[0, 0] = 99
+
+            assert event.precipitation_per_timestep[0, 0] == 0.2
+            assert not event.precipitation_per_timestep.flags.writeable
+
+        def test_given_parsed_array_takes_over_precipitations(self):
+            precipitations = np.array([[0.2, 0.4], [0.6, 0.8]])
+            event = BuiPrecipitationEvent._from_parsed(
+                start_time=datetime(1996, 1, 1),
+                timeseries_length=timedelta(seconds=120),
+                precipitation_per_timestep=precipitations,
+            )
+
+            assert event.precipitation_per_timestep is precipitations
+            assert not precipitations.flags.writeable
+
+        def test_given_flat_list_of_precipitations_raises(self):
+            with pytest.raises(ValueError):
+                BuiPrecipitationEvent(
+                    start_time=datetime(1996, 1, 1),
+                    timeseries_length=timedelta(seconds=120),
+                    precipitation_per_timestep=[0.2, 0.4, 0.6],
+                )
+
+        def test_given_event_mappings_model_validates_events(self):
+            event_values = dict(
+                start_time="1996-01-01T00:00:00",
+                timeseries_length=120,
+                precipitation_per_timestep=[[0.2], [0.4]],
+            )
+            model = BuiModel(
+                number_of_stations=1,
+                name_of_stations=["Station1"],
+                number_of_events=1,
+                seconds_per_timestep=60,
+                precipitation_events=[event_values],
+            )
+
+            event = model.precipitation_events[0]
+            assert isinstance(event, BuiPrecipitationEvent)
+            assert event.start_time == datetime(1996, 1, 1)
+            assert event.timeseries_length == timedelta(seconds=120)
+
+            with pytest.raises(ValidationError):
+                model.precipitation_events = [dict(event_values, start_time="no date")]
+
+        def test_event_is_immutable_and_can_be_pickled(self):
+            event = BuiTestData.bui_model().precipitation_events[0]
+            with pytest.raises(AttributeError):
+                event.start_time = datetime(2000, 1, 1)
+            assert pickle.loads(pickle.dumps(event)) == event
+
         def test_get_station_precipitations_given_valid_station(self):
             default_bui_model = BuiTestData.bui_model()
             precipitation_event = default_bui_model.precipitation_events[0]
@@ -258,11 +549,10 @@ class TestParser:
             # 3. Verify final expectations.
             default_bui_model = BuiTestData.bui_model()
             assert dict_values is not None
-            assert dict_values["default_dataset"] == str(
-                default_bui_model.default_dataset
-            )
-            assert dict_values["number_of_stations"] == str(
-                default_bui_model.number_of_stations
+            assert dict_values["default_dataset"] == default_bui_model.default_dataset
+            assert (
+                dict_values["number_of_stations"]
+                == default_bui_model.number_of_stations
             )
             assert dict_values["name_of_stations"] == default_bui_model.name_of_stations
             assert dict_values["number_of_events"] == default_bui_model.number_of_events
@@ -277,9 +567,146 @@ class TestParser:
                 precipitation_event["timeseries_length"]
                 == default_event.timeseries_length
             )
-            assert precipitation_event["precipitation_per_timestep"] == [
-                list(map(str, v)) for v in default_event.precipitation_per_timestep
+            assert np.array_equal(
+                precipitation_event["precipitation_per_timestep"],
+                default_event.precipitation_per_timestep,
+            )
+
+        def test_given_same_file_twice_returns_independent_values(self):
+            test_file = BuiTestData.default_bui_file()
+
+            first_values = BuiParser.parse(test_file)
+            first_values["name_of_stations"].append("extra_station")
+            second_values = BuiParser.parse(test_file)
+
+            assert second_values is not first_values
+            assert "extra_station" not in second_values["name_of_stations"]
+            assert (
+                second_values["precipitation_events"]
+                is not first_values["precipitation_events"]
+            )
+            first_event = first_values["precipitation_events"][0]
+            second_event = second_values["precipitation_events"][0]
+            assert (
+                first_event["precipitation_per_timestep"]
+                is not second_event["precipitation_per_timestep"]
+            )
+
+        def test_given_multiple_events_parses_all_events(self):
+            test_file = test_input_dir / "rr_bui_rks" / "T_SEWER.rks"
+
+            events = BuiParser.parse(test_file)["precipitation_events"]
+
+            assert isinstance(events, list)
+            assert len(events) == 10
+            assert events[0]["start_time"] == datetime(2000, 1, 10)
+            assert events[-1]["start_time"] == datetime(2000, 12, 9)
+
+        def test_given_multiple_events_lazy_events_parses_events_when_accessed(self):
+            test_file = test_input_dir / "rr_bui_rks" / "T_SEWER.rks"
+
+            events = BuiParser.lazy_events(test_file)
+
+            assert isinstance(events, BuiEventSequence)
+            assert len(events) == 10
+            assert events[0]["start_time"] == datetime(2000, 1, 10)
+            assert events[-1]["start_time"] == datetime(2000, 12, 9)
+            assert [event["start_time"] for event in events[8:]] == [
+                events[8]["start_time"],
+                events[9]["start_time"],
             ]
+            assert len(list(events)) == 10
+            with pytest.raises(IndexError):
+                events[10]
+
+        def test_given_windows_line_endings_parses_header(self):
+            test_file = test_output_dir / "crlf.bui"
+            default_text = BuiTestData.default_bui_file().read_text(encoding="utf8")
+            test_file.write_bytes(default_text.replace("\n", "\r\n").encode("utf8"))
+
+            dict_values = BuiParser.parse(test_file)
+
+            assert dict_values["name_of_stations"] == [
+                BuiTestData.default_bui_station()
+            ]
+            assert dict_values["seconds_per_timestep"] == 10800
+            event = dict_values["precipitation_events"][0]
+            assert event["precipitation_per_timestep"].shape == (9, 1)
+            test_file.unlink()
+
+        def test_given_trailing_values_after_number_of_events_parses_header(self):
+            test_file = test_output_dir / "trailing_header_values.bui"
+            default_text = BuiTestData.default_bui_file().read_text(encoding="utf8")
+            test_file.write_text(
+                default_text.replace("\n1 10800\n", "\n1 10800 ! events, seconds\n"),
+                encoding="utf8",
+            )
+
+            dict_values = BuiParser.parse(test_file)
+
+            assert dict_values["number_of_events"] == 1
+            assert dict_values["seconds_per_timestep"] == 10800
+            event = dict_values["precipitation_events"][0]
+            assert event["precipitation_per_timestep"].shape == (9, 1)
+            test_file.unlink()
+
+        def test_given_invalid_header_raises(self):
+            test_file = test_output_dir / "invalid_header.bui"
+            test_file.write_text("* comment\nnot a dataset\n", encoding="utf8")
+
+            with pytest.raises(ValueError):
+                BuiParser.parse(test_file)
+            test_file.unlink()
+
+        def test_given_changed_file_accessing_events_raises(self):
+            test_file = test_output_dir / "changed_events.bui"
+            shutil.copyfile(BuiTestData.default_bui_file(), test_file)
+            events = BuiParser.lazy_events(test_file)
+
+            with test_file.open("a", encoding="utf8") as bui_file:
+                bui_file.write("0.2\n")
+
+            with pytest.raises(ValueError):
+                events[0]
+            test_file.unlink()
+
+        def test_iterating_events_opens_file_for_each_event(self):
+            test_file = test_output_dir / "iterated_events.bui"
+            shutil.copyfile(test_input_dir / "rr_bui_rks" / "T_SEWER.rks", test_file)
+            events = iter(BuiParser.lazy_events(test_file))
+            next(events)
+
+            with test_file.open("a", encoding="utf8") as bui_file:
+                bui_file.write("* changed\n")
+
+            with pytest.raises(ValueError):
+                next(events)
+            test_file.unlink()
+
+        def test_given_invalid_event_value_accessing_event_raises(self):
+            test_file = test_output_dir / "invalid_lazy_event.bui"
+            default_text = BuiTestData.default_bui_file().read_text(encoding="utf8")
+            test_file.write_text(default_text.replace("0.2\n", "abc\n", 1))
+            events = BuiParser.lazy_events(test_file)
+
+            with pytest.raises(ValueError) as error:
+                events[0]
+
+            assert str(test_file) in str(error.value)
+            assert "precipitation event 1" in str(error.value)
+            test_file.unlink()
+
+        def test_given_changed_file_parses_new_values(self):
+            test_file = test_output_dir / "changed_file.bui"
+            default_text = BuiTestData.default_bui_file().read_text(encoding="utf8")
+            test_file.write_text(default_text, encoding="utf8")
+            assert BuiParser.parse(test_file)["default_dataset"] == 1
+
+            test_file.write_text(
+                default_text.replace("\n1\n", "\n12\n", 1), encoding="utf8"
+            )
+            assert BuiParser.parse(test_file)["default_dataset"] == 12
+            test_file.unlink()
 
     class TestBuiEventParser:
         """
@@ -300,7 +727,9 @@ class TestParser:
             assert parsed_dict["timeseries_length"] == timedelta(
                 days=1, minutes=4, seconds=20
             )
-            assert parsed_dict["precipitation_per_timestep"] == [["4.2"], ["4.2"]]
+            assert np.array_equal(
+                parsed_dict["precipitation_per_timestep"], [[4.2], [4.2]]
+            )
 
         def test_given_multiple_stations(self):
             raw_text = inspect.cleandoc(
@@ -315,10 +744,30 @@ class TestParser:
             assert parsed_dict["timeseries_length"] == timedelta(
                 days=1, minutes=4, seconds=20
             )
-            assert parsed_dict["precipitation_per_timestep"] == [
-                ["4.2", "2.4"],
-                ["4.2", "2.4"],
-            ]
+            assert np.array_equal(
+                parsed_dict["precipitation_per_timestep"],
+                [
+                    [4.2, 2.4],
+                    [4.2, 2.4],
+                ],
+            )
+
+        @pytest.mark.parametrize(
+            "raw_text",
+            [
+                pytest.param("4.2 2.4\n4.2", id="Short last line"),
+                pytest.param("1 2\n3\n4 5 6", id="Same number of values in total"),
+            ],
+        )
+        def test_given_different_number_of_stations_per_timestep_raises(
+            self, raw_text: str
+        ):
+            with pytest.raises(ValueError):
+                BuiEventParser.parse_precipitation_per_timestep(raw_text)
+
+        def test_given_no_precipitations_returns_empty_array(self):
+            parsed_precipitations = BuiEventParser.parse_precipitation_per_timestep("")
+            assert parsed_precipitations.shape == (0, 0)
 
         def test_parse_event_time_reference(self):
             raw_text = "2021 12 20 0 0 0 0 0 2 0"
@@ -345,7 +794,9 @@ class TestParser:
             parsed_event = parsed_list[0]
             assert parsed_event["start_time"] == datetime(2021, 12, 20)
             assert parsed_event["timeseries_length"] == timedelta(seconds=120)
-            assert parsed_event["precipitation_per_timestep"] == [["4.2"], ["4.2"]]
+            assert np.array_equal(
+                parsed_event["precipitation_per_timestep"], [[4.2], [4.2]]
+            )
 
         def test_given_mulitple_events(self):
             # 1. Define test data.
@@ -382,16 +833,21 @@ class TestParser:
             first_event = parsed_list[0]
             assert first_event["start_time"] == datetime(2021, 12, 20)
             assert first_event["timeseries_length"] == timedelta(minutes=2)
-            assert first_event["precipitation_per_timestep"] == [["4.2"], ["4.2"]]
+            assert np.array_equal(
+                first_event["precipitation_per_timestep"], [[4.2], [4.2]]
+            )
             # Evaluate second event.
             second_event = parsed_list[1]
             assert second_event["start_time"] == datetime(2021, 12, 20)
             assert second_event["timeseries_length"] == timedelta(minutes=3)
-            assert second_event["precipitation_per_timestep"] == [
-                ["2.4"],
-                ["2.4"],
-                ["2.4"],
-            ]
+            assert np.array_equal(
+                second_event["precipitation_per_timestep"],
+                [
+                    [2.4],
+                    [2.4],
+                    [2.4],
+                ],
+            )
 
 
 class TestSerializer:
@@ -533,6 +989,32 @@ class TestSerializer:
             )
             assert serialized_text == expected_string
 
+        def test_given_event_models_serialize_event_list_into_text(self):
+            event_list = [
+                BuiPrecipitationEvent(
+                    start_time=datetime(1996, 1, 1),
+                    timeseries_length=timedelta(seconds=120),
+                    precipitation_per_timestep=[[0.24]] * 2,
+                )
+            ]
+
+            config = SerializerConfig(float_format=".3f")
+            serialized_text = BuiSerializer.serialize_event_list(event_list, config)
+
+            expected_string = inspect.cleandoc(
+                """
+                * Event 1 duration days:0 hours:0 minutes:2 seconds:0
+                * Start date and time of the event: yyyy mm dd hh mm ss
+                * Duration of the event           : dd hh mm ss
+                * Rainfall value per time step [mm/time step]
+                1996 1 1 0 0 0 0 0 2 0
+                0.240
+                0.240
+            """
+            )
+            assert serialized_text == expected_string
+            assert event_list[0].start_time == datetime(1996, 1, 1)
+
     class TestBuiEventSerializer:
         """
         Test class pointing to hydrolib.core.rr.meteo.serializer to test
@@ -589,6 +1071,28 @@ class TestSerializer:
             expected_string = "4 2 2 4"
             assert serialized_td == expected_string
 
+        @pytest.mark.parametrize(
+            "duration, expected_string",
+            [
+                pytest.param(timedelta(4, 2000), "4 0 33 20", id="Days and seconds"),
+                pytest.param(timedelta(seconds=86399), "0 23 59 59", id="Below a day"),
+                pytest.param(timedelta(0), "0 0 0 0", id="Zero"),
+            ],
+        )
+        def test_given_timedelta_serialize_timeseries_length_in_fields(
+            self, duration: timedelta, expected_string: str
+        ):
+            serialized_td = BuiEventSerializer.serialize_timeseries_length(duration)
+            assert serialized_td == expected_string
+
+        def test_given_multiple_stations_serialize_precipitation_per_timestep(self):
+            precipitations = np.array([[0.1, 0.2, 0.3], [1.23, 2.34, 3.45]])
+            config = SerializerConfig(float_format=".1f")
+            serialized_text = BuiEventSerializer.serialize_precipitation_per_timestep(
+                precipitations, config
+            )
+            assert serialized_text == "0.1 0.2 0.3\n1.2 2.3 3.5"
+
         def test_given_precipitationlist_serialize_precipitation_per_timestep(self):
             precipitation_list = [[2.4]] * 4
             config = SerializerConfig(float_format=".2f")
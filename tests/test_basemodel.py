@@ -1,4 +1,5 @@
 import filecmp
+import pickle
 import platform
 import shutil
 from pathlib import Path
@@ -7,6 +8,7 @@ from typing import Sequence, Tuple
 import pytest
 
 from hydrolib.core.basemodel import (
+    _FORMAT_REGISTRY,
     DiskOnlyFileModel,
     FileCasingResolver,
     FileLoadContext,
@@ -22,7 +24,10 @@ from hydrolib.core.basemodel import (
     context_file_loading,
     file_load_context,
 )
-from hydrolib.core.dflowfm.mdu.models import FMModel
+from hydrolib.core.config import settings
+from hydrolib.core.dflowfm.mdu.models import FMModel, Geometry
+from hydrolib.core.dflowfm.obs.models import ObservationPointModel
+from hydrolib.core.dflowfm.xyn.models import XYNModel
 from hydrolib.core.dimr.models import DIMR
 from hydrolib.core.utils import PathStyle
 from tests.utils import test_input_dir, test_output_dir
@@ -46,6 +51,32 @@ class TestFileModel:
         # If this test fails the other tests are basically useless.
         assert issubclass(DIMR, ParsableFileModel)
 
+    def test_generate_name_combines_filename_and_extension(self):
+        assert DIMR._generate_name() == Path("dimr_config.xml")
+        assert FMModel._generate_name() == Path("fm.mdu")
+
+    def test_format_spec_is_registered_on_first_use(self):
+        DIMR._generate_name()
+
+        spec = _FORMAT_REGISTRY[DIMR]
+        assert spec.default_name == Path("dimr_config.xml")
+        assert spec.parser == DIMR._get_parser()
+        assert spec.serializer == DIMR._get_serializer()
+
+    def test_set_filepath_unvalidated_marks_filepath_as_set(self):
+        model = DIMR()
+        model._set_filepath_unvalidated(Path("dimr.xml"))
+
+        assert model.filepath == Path("dimr.xml")
+        assert "filepath" in model.__fields_set__
+
+    def test_model_field_names_only_contain_fields_that_may_hold_models(self):
+        assert "netfile" in Geometry._model_field_names
+        assert "comments" in Geometry._model_field_names
+        assert "uniformwidth1d" not in Geometry._model_field_names
+        assert "general" in FMModel._model_field_names
+        assert "filepath" not in FMModel._model_field_names
+
     def test_loading_a_file_twice_returns_different_model_instances(self) -> None:
         # If the same source file is read multiple times, we expect that
         # multiple (deep) copies are returned, and not references to the
@@ -348,6 +379,65 @@ class TestFileModel:
         model = FMModel(given_path)
         assert model.filepath == expected_path
 
+    def test_given_cache_parse_setting_does_not_share_cache_between_types(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "HYDROLIB_CACHE_PARSE", True)
+        test_file = test_output_dir / "cached_obs.ini"
+        shutil.copyfile(
+            test_input_dir / "obsfile_cases" / "single_ini" / "obs.ini", test_file
+        )
+        model_name = f"{ObservationPointModel.__module__}.ObservationPointModel"
+        cache_file = test_output_dir / f"cached_obs.ini.{model_name}.pkl"
+
+        first_model = ObservationPointModel(filepath=test_file)
+        assert cache_file.is_file()
+
+        with pytest.raises(ValueError, match="Error parsing XYN file"):
+            XYNModel(filepath=test_file)
+        second_model = ObservationPointModel(filepath=test_file)
+
+        assert second_model.observationpoint == first_model.observationpoint
+        test_file.unlink()
+        cache_file.unlink()
+
+    def test_given_cache_parse_setting_and_outdated_cache_parses_file(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "HYDROLIB_CACHE_PARSE", True)
+        test_file = test_output_dir / "outdated_cache_obs.ini"
+        shutil.copyfile(
+            test_input_dir / "obsfile_cases" / "single_ini" / "obs.ini", test_file
+        )
+        model_name = f"{ObservationPointModel.__module__}.ObservationPointModel"
+        cache_file = test_output_dir / f"outdated_cache_obs.ini.{model_name}.pkl"
+        stat = test_file.stat()
+        outdated_stamp = ("0.0.0", 0, stat.st_mtime_ns, stat.st_size)
+        cache_file.write_bytes(pickle.dumps((outdated_stamp, {"observationpoint": 1})))
+
+        model = ObservationPointModel(filepath=test_file)
+
+        assert len(model.observationpoint) == 2
+        test_file.unlink()
+        cache_file.unlink()
+
+    def test_given_cache_parse_setting_and_invalid_cache_parses_file(self, monkeypatch):
+        monkeypatch.setattr(settings, "HYDROLIB_CACHE_PARSE", True)
+        test_file = test_output_dir / "invalid_cache_obs.ini"
+        shutil.copyfile(
+            test_input_dir / "obsfile_cases" / "single_ini" / "obs.ini", test_file
+        )
+        model_name = f"{ObservationPointModel.__module__}.ObservationPointModel"
+        cache_file = test_output_dir / f"invalid_cache_obs.ini.{model_name}.pkl"
+        cache_file.write_bytes(b"not a pickle")
+
+        model = ObservationPointModel(filepath=test_file)
+
+        assert len(model.observationpoint) == 2
+        assert ObservationPointModel(filepath=test_file) == model
+        test_file.unlink()
+        cache_file.unlink()
+
 
 class TestContextManagerFileLoadContext:
     def test_context_is_created_and_disposed_properly(self):
@@ -1,4 +1,5 @@
 import platform
+import sys
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,7 @@ from hydrolib.core.utils import (
     PathStyle,
     get_substring_between,
     str_is_empty_or_none,
+    to_key,
 )
 
 from .utils import test_input_dir
@@ -48,6 +50,13 @@ class TestSplitString:
         assert output.structurefile[1].filepath == Path(file2)
 
 
+class TestToKey:
+    def test_given_header_returns_interned_key(self):
+        key = to_key("Storage Node-Id")
+        assert key == "storage_nodeid"
+        assert key is sys.intern("storage_nodeid")
+
+
 class TestStrIsEmptyOrNone:
     @pytest.mark.parametrize(
         "input_str",